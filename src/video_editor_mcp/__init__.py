@@ -1,7 +1,58 @@
 import asyncio
+import glob
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from . import server
+HEAVY_IMPORTS = ("torch", "transformers")
+MODEL_CACHE_DIR = "models--jinaai--jina-clip-v1"
+PREFETCH_BLOCK = 16 * 1024 * 1024
+
+
+def _import_quietly(names):
+    # One after another on a single thread; importing them concurrently
+    # only contends on the import locks with the main thread
+    for name in names:
+        try:
+            __import__(name)
+        except Exception:
+            # The loaders report the real error
+            pass
+
+
+def _read_through(path: str):
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while f.read(PREFETCH_BLOCK):
+                pass
+    except OSError:
+        pass
+
+
+def _prefetch_model_weights():
+    """Read the cached model weights once so from_pretrained hits page cache."""
+    hub_dir = os.environ.get("HF_HUB_CACHE") or os.path.join(
+        os.environ.get("HF_HOME", os.path.expanduser("~/.cache/huggingface")), "hub"
+    )
+    paths = glob.glob(
+        os.path.join(hub_dir, MODEL_CACHE_DIR, "**", "*.safetensors"), recursive=True
+    )
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pool.map(_read_through, paths)
+
+
+def _warm_start():
+    """
+    Start the slow imports and weight reads in the background, so they
+    overlap with the server module's own imports instead of running after them.
+    """
+    names = list(HEAVY_IMPORTS)
+    # osxphotos is only needed when the Photos library is enabled
+    if sys.platform == "darwin" and os.environ.get("LOAD_PHOTOS_DB"):
+        names.append("osxphotos")
+    threading.Thread(target=_import_quietly, args=(names,), daemon=True).start()
+    threading.Thread(target=_prefetch_model_weights, daemon=True).start()
 
 
 def main():
@@ -11,6 +62,7 @@ def main():
         print("""Video Jungle MCP Server
 
 Usage: video-editor-mcp [OPTIONS] API_KEY
+       video-editor-mcp serve [--foreground] [--ttl SECONDS] [--status] [--stop] [API_KEY]
 
 A Model Context Protocol server for video editing operations using Video Jungle API.
 
@@ -20,9 +72,20 @@ Arguments:
 Options:
   --help     Show this help message and exit
 
+Commands:
+  serve      Start a background daemon that keeps the embedding model loaded.
+             While it runs, new sessions with the same API key,
+             LOAD_PHOTOS_DB setting and working directory connect to it
+             instead of loading the model themselves.
+
 Environment Variables:
   VJ_API_KEY        Video Jungle API key (alternative to command line argument)
   LOAD_PHOTOS_DB    Set to 1 to enable Photos database integration
+  VJ_QUANTIZED      Set to 1 to run the embedding model with int8 weights
+  VJ_TORCH_THREADS  CPU threads for the embedding model (default: all cores)
+  VJ_COMPILE        Set to 1 to torch.compile the embedding model
+  VJ_MODEL_DTYPE    bf16 or fp16 to load the embedding model in half precision
+  VJ_LOG_LEVEL      Level for app.log, e.g. WARNING to keep it quiet (default: INFO)
 
 Examples:
   # Run with API key as argument
@@ -35,11 +98,37 @@ Examples:
   # Run with Photos database access
   LOAD_PHOTOS_DB=1 video-editor-mcp your-api-key-here
 
+  # Keep the model warm between sessions
+  video-editor-mcp serve your-api-key-here
+
 For more information, visit: https://github.com/burningion/video-editing-mcp""")
         sys.exit(0)
 
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from .daemon import main_daemon
+
+        sys.exit(main_daemon(sys.argv[2:]))
+
+    # Hand the session to a running daemon before paying for any heavy imports
+    from .daemon import main_client
+
+    if main_client():
+        return
+
+    _warm_start()
+    from . import server
+
     asyncio.run(server.main())
 
 
+def __getattr__(name):
+    # The server module loads torch and the model, so import it on first use
+    if name == "server":
+        from . import server
+
+        return server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Optionally expose other important items at package level
 __all__ = ["main", "server"]
@@ -0,0 +1,333 @@
+"""
+Keep the embedding model and Photos library resident between MCP sessions.
+
+`video-editor-mcp serve` starts a daemon that listens on a UNIX socket and
+runs one MCP session per connection. While it is up, a plain
+`video-editor-mcp` invocation relays its stdio over the socket instead of
+importing torch and loading the model weights itself. A session is only
+handed over when the client's API key, LOAD_PHOTOS_DB setting and working
+directory match the daemon's; otherwise the client runs in-process.
+
+Only the standard library is imported here; the server module is loaded by
+the daemon process alone.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import List, Optional
+
+DAEMON_DIR = os.path.expanduser("~/.vj-mcp")
+SOCKET_PATH = os.path.join(DAEMON_DIR, "daemon.sock")
+PID_PATH = os.path.join(DAEMON_DIR, "daemon.pid")
+DEFAULT_TTL = 30 * 60  # exit after 30 idle minutes
+HANDSHAKE_TIMEOUT = 5.0
+
+
+def _api_key() -> Optional[str]:
+    """
+    Find the API key the way the server does: environment, first argument,
+    then a .env file in the working directory.
+    """
+    if os.environ.get("VJ_API_KEY"):
+        return os.environ["VJ_API_KEY"]
+    if len(sys.argv) > 1:
+        return sys.argv[1]
+    try:
+        with open(".env") as f:
+            for line in f:
+                if line.startswith("VJ_API_KEY="):
+                    return line.split("=", 1)[1].strip().strip("\"'")
+    except OSError:
+        pass
+    return None
+
+
+def session_identity(api_key: Optional[str]) -> dict:
+    """
+    The settings a session depends on. The daemon only serves clients whose
+    identity matches its own.
+    """
+    return {
+        "api_key": hashlib.sha256((api_key or "").encode()).hexdigest(),
+        "load_photos_db": bool(os.environ.get("LOAD_PHOTOS_DB")),
+        "cwd": os.getcwd(),
+    }
+
+
+def read_pid() -> Optional[int]:
+    """
+    Return the daemon's PID if the pidfile points at a live process.
+    """
+    try:
+        with open(PID_PATH) as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+    except (OSError, ValueError):
+        return None
+    return pid
+
+
+def connect(timeout: float = 0.5) -> Optional[socket.socket]:
+    """
+    Connect to a running daemon, or return None if there isn't one.
+    """
+    if read_pid() is None:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(SOCKET_PATH)
+        # Handshake: the daemon answers "ok" only if this session would see
+        # the same key, Photos setting and working directory in-process
+        hello = json.dumps(session_identity(_api_key())) + "\n"
+        sock.sendall(hello.encode())
+        sock.settimeout(HANDSHAKE_TIMEOUT)
+        reply = b""
+        # Byte at a time, so nothing past the reply is consumed
+        while not reply.endswith(b"\n") and len(reply) < 64:
+            byte = sock.recv(1)
+            if not byte:
+                break
+            reply += byte
+    except OSError:
+        sock.close()
+        return None
+    if reply.strip() != b"ok":
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def relay(sock: socket.socket) -> None:
+    """
+    Pump this process's stdin/stdout through the daemon until it hangs up.
+    """
+
+    def upstream():
+        try:
+            while chunk := os.read(sys.stdin.fileno(), 65536):
+                sock.sendall(chunk)
+        except OSError:
+            pass
+        finally:
+            # Let the daemon see EOF so it closes the session
+            try:
+                sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    threading.Thread(target=upstream, daemon=True).start()
+
+    out = sys.stdout.buffer
+    with sock:
+        while chunk := sock.recv(65536):
+            out.write(chunk)
+            out.flush()
+
+
+def main_client() -> bool:
+    """
+    Serve this MCP session through the daemon if one is running.
+    Returns False when the caller should run the server in-process.
+    """
+    sock = connect()
+    if sock is None:
+        return False
+    relay(sock)
+    return True
+
+
+async def _read_line(conn: socket.socket, limit: int = 65536) -> bytes:
+    loop = asyncio.get_running_loop()
+    data = b""
+    while not data.endswith(b"\n") and len(data) < limit:
+        chunk = await loop.sock_recv(conn, 4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+async def _serve_connection(conn: socket.socket, server, identity: dict) -> None:
+    import anyio
+
+    loop = asyncio.get_running_loop()
+    try:
+        hello = await asyncio.wait_for(_read_line(conn), HANDSHAKE_TIMEOUT)
+        matches = json.loads(hello) == identity
+    except (asyncio.TimeoutError, OSError, ValueError):
+        matches = False
+    if not matches:
+        logging.info("Daemon refused a session with different settings")
+        try:
+            await loop.sock_sendall(conn, b"mismatch\n")
+        except OSError:
+            pass
+        conn.close()
+        return
+    await loop.sock_sendall(conn, b"ok\n")
+
+    conn.setblocking(True)
+    rfile = conn.makefile("r", encoding="utf-8", newline="\n")
+    wfile = conn.makefile("w", encoding="utf-8", newline="\n")
+    try:
+        await server.main(anyio.wrap_file(rfile), anyio.wrap_file(wfile))
+    except Exception as e:
+        logging.error("Daemon session ended with error: %s", e)
+    finally:
+        rfile.close()
+        wfile.close()
+        conn.close()
+
+
+async def _serve(ttl: float) -> None:
+    # Importing the server starts the model (and Photos) loaders
+    from . import server
+
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket owner-only from the start, rather than chmodding it
+    # after bind and leaving a window where anyone could connect
+    old_umask = os.umask(0o177)
+    try:
+        listener.bind(SOCKET_PATH)
+    finally:
+        os.umask(old_umask)
+    listener.listen()
+    listener.setblocking(False)
+    logging.info("Daemon listening on %s", SOCKET_PATH)
+
+    identity = session_identity(server.VJ_API_KEY)
+    loop = asyncio.get_running_loop()
+    sessions: set = set()
+    idle_since = time.monotonic()
+    with listener:
+        while True:
+            try:
+                conn, _ = await asyncio.wait_for(loop.sock_accept(listener), 5)
+            except asyncio.TimeoutError:
+                if sessions:
+                    idle_since = time.monotonic()
+                elif ttl > 0 and time.monotonic() - idle_since > ttl:
+                    logging.info("Daemon idle for %ss, exiting", ttl)
+                    return
+                continue
+            task = asyncio.create_task(_serve_connection(conn, server, identity))
+            sessions.add(task)
+            task.add_done_callback(sessions.discard)
+
+
+def serve(ttl: float) -> int:
+    """
+    Run the daemon in this process until it is stopped or idles out.
+    """
+    os.makedirs(DAEMON_DIR, mode=0o700, exist_ok=True)
+    # makedirs leaves an existing directory's mode alone
+    os.chmod(DAEMON_DIR, 0o700)
+    pid = read_pid()
+    if pid is not None:
+        print(f"Daemon already running (pid {pid})", file=sys.stderr)
+        return 1
+
+    with open(PID_PATH, "w") as f:
+        f.write(str(os.getpid()))
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        asyncio.run(_serve(ttl))
+    finally:
+        for path in (SOCKET_PATH, PID_PATH):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    return 0
+
+
+def stop(timeout: float = 5.0) -> int:
+    pid = read_pid()
+    if pid is None:
+        print("Daemon not running")
+        return 1
+    os.kill(pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if read_pid() is None:
+            print(f"Daemon stopped (pid {pid})")
+            return 0
+        time.sleep(0.1)
+    print(f"Daemon (pid {pid}) did not exit", file=sys.stderr)
+    return 1
+
+
+def status() -> int:
+    pid = read_pid()
+    if pid is None:
+        print("Daemon not running")
+        return 1
+    print(f"Daemon running (pid {pid}), socket {SOCKET_PATH}")
+    return 0
+
+
+def main_daemon(argv: List[str]) -> int:
+    """
+    Entry point for `video-editor-mcp serve`.
+    """
+    parser = argparse.ArgumentParser(prog="video-editor-mcp serve")
+    parser.add_argument("api_key", nargs="?", help="Video Jungle API key")
+    parser.add_argument("--foreground", action="store_true", help="Run in this process")
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="Seconds without a session before exiting, 0 to never exit",
+    )
+    parser.add_argument("--status", action="store_true", help="Report daemon status")
+    parser.add_argument("--stop", action="store_true", help="Stop the daemon")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        return status()
+    if args.stop:
+        return stop()
+
+    if args.api_key:
+        os.environ["VJ_API_KEY"] = args.api_key
+    if args.foreground:
+        # The server falls back to sys.argv[1] for the API key
+        sys.argv = sys.argv[:1]
+        return serve(args.ttl)
+
+    if read_pid() is not None:
+        return status()
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "video_editor_mcp.daemon",
+            "--foreground",
+            "--ttl",
+            str(args.ttl),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    print(f"Daemon starting, socket {SOCKET_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_daemon(sys.argv[1:]))
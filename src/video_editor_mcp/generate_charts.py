@@ -277,7 +277,7 @@ if __name__ == "__main__":
         # Check command line arguments
         if len(sys.argv) < 3:
             print(
-                "Usage: python generate_charts.py <input_json_file> <chart_type>",
+                "Usage: python generate_charts.py <input_json_file|-> <chart_type>",
                 file=sys.stderr,
             )
             sys.exit(1)
@@ -294,10 +294,13 @@ if __name__ == "__main__":
             )
             sys.exit(1)
 
-        # Read and validate JSON data
+        # Read and validate JSON data, from stdin when the file is "-"
         try:
-            with open(input_json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if input_json_file == "-":
+                data = json.load(sys.stdin)
+            else:
+                with open(input_json_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
         except FileNotFoundError:
             print(f"Input file not found: {input_json_file}", file=sys.stderr)
             sys.exit(1)
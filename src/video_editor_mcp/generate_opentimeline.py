@@ -2,18 +2,29 @@ import opentimelineio as otio
 from videojungle import ApiClient
 import os
 import sys
-import json
 import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import numpy as np
+import orjson
 import requests
 
-logging.basicConfig(
-    filename="app.log",  # Name of the log file
-    level=logging.INFO,  # Log level (e.g., DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    format="%(asctime)s - %(levelname)s - %(message)s",  # Log format
-)
+logger = logging.getLogger(__name__)
 
-vj = ApiClient(os.environ.get("VJ_API_KEY"))
+_default_client = None
+
+
+def default_client():
+    """ApiClient for command-line use, built from VJ_API_KEY on first use."""
+    global _default_client
+    if _default_client is None:
+        _default_client = ApiClient(os.environ.get("VJ_API_KEY"))
+    return _default_client
+
+
+# Maximum number of assets downloaded at once
+DOWNLOAD_WORKERS = 8
 
 
 def timecode_to_frames(timecode, fps=24.0):
@@ -28,40 +39,62 @@ def timecode_to_frames(timecode, fps=24.0):
 
         total_seconds = hours * 3600 + minutes * 60 + seconds
         return int(total_seconds * fps)
-    except (ValueError, IndexError) as e:
+    except (ValueError, IndexError, OverflowError) as e:
         raise ValueError(f"Invalid timecode format: {timecode}") from e
 
 
+def timecodes_to_frames_batch(timecodes, fps=24.0):
+    """
+    Convert a list of HH:MM:SS.xxx timecodes to frames in one vectorized pass.
+    Returns an int64 array with the same truncation as timecode_to_frames.
+    """
+    if not timecodes:
+        return np.empty(0, dtype=np.int64)
+    try:
+        parts = np.array(
+            [timecode.split(":")[:3] for timecode in timecodes], dtype=np.float64
+        )
+        total_seconds = parts[:, 0] * 3600 + parts[:, 1] * 60 + parts[:, 2]
+    except (ValueError, IndexError):
+        total_seconds = None
+    # float() also accepts "nan" and "inf", which astype would turn into
+    # garbage frame counts
+    if total_seconds is None or not np.isfinite(total_seconds).all():
+        # Re-run per timecode so the error names the offending value
+        return np.array(
+            [timecode_to_frames(timecode, fps) for timecode in timecodes],
+            dtype=np.int64,
+        )
+    return (total_seconds * fps).astype(np.int64)
+
+
 def create_rational_time(timecode, fps=24.0):
     """Create RationalTime object from HH:MM:SS.xxx format"""
     frames = timecode_to_frames(timecode, fps)
     return otio.opentime.RationalTime(frames, fps)
 
 
-def download_asset(asset_id, asset_type, download_dir="downloads"):
+def download_asset(asset_id, asset_type, download_dir="downloads", client=None):
     """Download an asset using either the assets API or video files API based on type"""
+    client = client or default_client()
     try:
         # Determine which API to use based on asset type
         if asset_type in ["user", "audio", "mp3", "wav", "aac", "m4a"]:
             # Use assets API for user uploads and audio files
-            asset = vj.assets.get(asset_id)
+            asset = client.assets.get(asset_id)
             if not asset.download_url:
-                logging.error(f"No download URL for asset {asset_id}")
+                logger.error("No download URL for asset %s", asset_id)
                 return None
             download_url = asset.download_url
-            filename = (
-                asset.name if hasattr(asset, "name") and asset.name else str(asset_id)
-            )
+            name = asset.name if hasattr(asset, "name") else None
         else:
             # Use video files API for video files
-            video = vj.video_files.get(asset_id)
+            video = client.video_files.get(asset_id)
             if not video.download_url:
-                logging.error(f"No download URL for video {asset_id}")
+                logger.error("No download URL for video %s", asset_id)
                 return None
             download_url = video.download_url
-            filename = (
-                video.name if hasattr(video, "name") and video.name else str(asset_id)
-            )
+            name = video.name if hasattr(video, "name") else None
 
         # Determine file extension based on asset type
         ext_map = {
@@ -75,44 +108,79 @@ def download_asset(asset_id, asset_type, download_dir="downloads"):
         }
         ext = ext_map.get(asset_type, ".mp4")
 
-        # Remove any existing extension and add the correct one
-        if "." in filename:
-            filename = filename.rsplit(".", 1)[0]
+        # Remove any existing extension and add the correct one. The id is
+        # kept in the name so two assets that share a name don't collide
+        filename = str(asset_id)
+        if name:
+            if "." in name:
+                name = name.rsplit(".", 1)[0]
+            filename = f"{name}_{asset_id}"
         local_file = os.path.join(download_dir, f"{filename}{ext}")
 
         # Check if file already exists
         if os.path.exists(local_file):
-            logging.info(f"Asset already exists at {local_file}, skipping download")
+            logger.info("Asset already exists at %s, skipping download", local_file)
             return local_file
 
-        # Download the file
-        if asset_type in ["user", "audio", "mp3", "wav", "aac", "m4a"]:
-            # Use requests for assets API downloads
-            response = requests.get(download_url, stream=True)
-            response.raise_for_status()
-
-            with open(local_file, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-        else:
-            # Use video files download method
-            lf = vj.video_files.download(asset_id, local_file)
-            logging.info(f"Downloaded video to {lf}")
-            return lf
-
-        logging.info(f"Downloaded asset {asset_id} to {local_file}")
+        # Download to a temporary file and move it into place once complete,
+        # so a partial download is never mistaken for a finished one
+        fd, tmp_file = tempfile.mkstemp(
+            prefix=f".{filename}.", suffix=f"{ext}.part", dir=download_dir
+        )
+        os.close(fd)
+        try:
+            if asset_type in ["user", "audio", "mp3", "wav", "aac", "m4a"]:
+                # Use requests for assets API downloads
+                response = requests.get(download_url, stream=True)
+                response.raise_for_status()
+
+                with open(tmp_file, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+            else:
+                # Use video files download method
+                client.video_files.download(asset_id, tmp_file)
+            os.replace(tmp_file, local_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+        logger.info("Downloaded asset %s to %s", asset_id, local_file)
         return local_file
 
     except Exception as e:
-        logging.error(f"Error downloading asset {asset_id}: {e}")
+        logger.error("Error downloading asset %s: %s", asset_id, e)
         return None
 
 
+def download_assets(assets, download_dir="downloads", client=None):
+    """
+    Download (asset_id, asset_type) pairs concurrently, fetching each unique
+    pair only once. Returns a dict mapping each pair to its local file.
+    """
+    unique_assets = list(dict.fromkeys(assets))
+    if not unique_assets:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(DOWNLOAD_WORKERS, len(unique_assets))
+    ) as pool:
+        local_files = pool.map(
+            lambda asset: download_asset(asset[0], asset[1], download_dir, client),
+            unique_assets,
+        )
+        return dict(zip(unique_assets, local_files))
+
+
 def create_otio_timeline(
-    edit_spec, filename, download_dir="downloads"
+    edit_spec, filename, download_dir="downloads", client=None
 ) -> otio.schema.Timeline:
-    if not os.path.exists(download_dir):
-        os.makedirs(download_dir)
+    """
+    Download an edit's media and write it out as an OTIO timeline. client
+    defaults to an ApiClient built from the VJ_API_KEY environment variable.
+    """
+    os.makedirs(download_dir, exist_ok=True)
 
     timeline = otio.schema.Timeline(name=edit_spec.get("name", "Timeline"))
 
@@ -126,17 +194,38 @@ def create_otio_timeline(
         audio_track = otio.schema.Track(name="A1", kind=otio.schema.TrackKind.Audio)
         timeline.tracks.append(audio_track)
 
+    # Convert every cut's timecodes up front, so a bad timecode fails
+    # before anything is downloaded
+    fps = edit_spec.get("video_output_fps", 24.0)
+    cuts = edit_spec.get("video_series_sequential") or []
+    if not cuts:
+        logger.warning("Edit spec has no video cuts, timeline will be empty")
+    start_frames = timecodes_to_frames_batch(
+        [cut["video_start_time"] for cut in cuts], fps
+    )
+    end_frames = timecodes_to_frames_batch([cut["video_end_time"] for cut in cuts], fps)
+
+    # Fetch every video and audio source up front in one batch, so an asset
+    # shared between cuts or overlays is only requested once, then build
+    # clips in order
+    assets = [(cut["video_id"], cut.get("type", "video")) for cut in cuts]
+    if audio_track:
+        assets.extend(
+            (audio_item["audio_id"], audio_item.get("type", "mp3"))
+            for audio_item in edit_spec["audio_overlay"]
+        )
+    local_files = download_assets(assets, download_dir, client)
+
     # Process video clips
-    for cut in edit_spec["video_series_sequential"]:
+    for cut, start_frame, end_frame in zip(cuts, start_frames, end_frames):
         asset_type = cut.get("type", "video")
-        local_file = download_asset(cut["video_id"], asset_type, download_dir)
+        local_file = local_files[(cut["video_id"], asset_type)]
 
         if not local_file:
             continue
 
-        fps = edit_spec.get("video_output_fps", 24.0)
-        start_time = create_rational_time(cut["video_start_time"], fps)
-        end_time = create_rational_time(cut["video_end_time"], fps)
+        start_time = otio.opentime.RationalTime(int(start_frame), fps)
+        end_time = otio.opentime.RationalTime(int(end_frame), fps)
 
         clip = otio.schema.Clip(
             name=f"clip_{cut['video_id']}",
@@ -167,9 +256,7 @@ def create_otio_timeline(
     if audio_track and "audio_overlay" in edit_spec:
         for audio_item in edit_spec["audio_overlay"]:
             audio_type = audio_item.get("type", "mp3")
-            local_audio_file = download_asset(
-                audio_item["audio_id"], audio_type, download_dir
-            )
+            local_audio_file = local_files[(audio_item["audio_id"], audio_type)]
 
             if not local_audio_file:
                 continue
@@ -195,17 +282,15 @@ def create_otio_timeline(
             audio_track.append(audio_clip)
 
     otio.adapters.write_to_file(timeline, filename)
-    logging.info(f"OTIO timeline saved to {filename}")
+    logger.info("OTIO timeline saved to %s", filename)
+    return timeline
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--file", help="JSON file path")
-    parser.add_argument("--output", help="Output file path")
-    parser.add_argument("--json", type=json.loads, help="JSON string")
-
-    args = parser.parse_args()
-    spec = None
+def import_into_resolve(filename, timeline_name):
+    """
+    Import a written OTIO timeline into the current DaVinci Resolve project,
+    if Resolve's scripting API is installed and running.
+    """
     # Set DaVinci Resolve environment variables
     os.environ["RESOLVE_SCRIPT_API"] = (
         "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
@@ -223,18 +308,56 @@ if __name__ == "__main__":
     try:
         import DaVinciResolveScript as dvr_script
     except ImportError:
-        # print(f"Error importing DaVinciResolveScript: {e}")
-        # print("Make sure DaVinci Resolve is installed correctly.")
-        # Re-raise the exception or set dvr_script to None as a fallback
-        dvr_script = None
+        # Resolve isn't installed; the .otio file is still usable on its own
+        return
+
+    resolve = dvr_script.scriptapp("Resolve")
+    if resolve:
+        project_manager = resolve.GetProjectManager()
+        project = project_manager.GetCurrentProject()
+        media_pool = project.GetMediaPool()
+        media_pool.ImportTimelineFromFile(
+            os.path.abspath(filename), {"timelineName": timeline_name}
+        )
+        logger.info("Imported %s into DaVinci Resolve", filename)
+    else:
+        logger.error("Could not connect to DaVinci Resolve.")
+
+
+if __name__ == "__main__":
+    # Only configure logging when run as a script; inside the server this
+    # module must not override the server's own configuration
+    logging.basicConfig(
+        filename="app.log",  # Name of the log file
+        level=logging.INFO,  # Log level (e.g., DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        format="%(asctime)s - %(levelname)s - %(message)s",  # Log format
+    )
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", help="JSON file path")
+    parser.add_argument("--output", help="Output file path")
+    parser.add_argument("--json", type=orjson.loads, help="JSON string")
+    parser.add_argument(
+        "--import-only",
+        action="store_true",
+        help="Import an existing --output file into DaVinci Resolve",
+    )
+    parser.add_argument("--name", help="Timeline name for --import-only")
+
+    args = parser.parse_args()
+    if args.import_only:
+        if not args.output:
+            parser.error("--import-only requires --output")
+        import_into_resolve(args.output, args.name or args.output)
+        sys.exit(0)
+    spec = None
 
     if args.json:
         spec = args.json
     elif args.file:
-        with open(args.file) as f:
-            spec = json.load(f)
+        with open(args.file, "rb") as f:
+            spec = orjson.loads(f.read())
     elif not sys.stdin.isatty():  # Check if data is being piped
-        spec = json.load(sys.stdin)
+        spec = orjson.loads(sys.stdin.buffer.read())
     else:
         parser.print_help()
         sys.exit(1)
@@ -243,16 +366,4 @@ if __name__ == "__main__":
     else:
         output_file = "output.otio"
     create_otio_timeline(spec, output_file)
-    output_file_absolute = os.path.abspath(output_file)
-    if dvr_script:
-        resolve = dvr_script.scriptapp("Resolve")
-        if resolve:
-            project_manager = resolve.GetProjectManager()
-            project = project_manager.GetCurrentProject()
-            media_pool = project.GetMediaPool()
-            media_pool.ImportTimelineFromFile(
-                output_file_absolute, {"timelineName": spec["name"]}
-            )
-            logging.info(f"Imported {output_file} into DaVinci Resolve")
-        else:
-            logging.error("Could not connect to DaVinci Resolve.")
+    import_into_resolve(output_file, spec["name"])
@@ -0,0 +1,126 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import osxphotos
+
+logger = logging.getLogger(__name__)
+
+
+def _library_mtime(db_path: str) -> Optional[float]:
+    """
+    Newest modification time among the files in the library's database
+    directory. On Photos 5+ libraries db_path is a legacy stub that never
+    changes; Photos.sqlite and its write-ahead log next to it do.
+    """
+    try:
+        with os.scandir(os.path.dirname(db_path)) as entries:
+            return max(
+                (entry.stat().st_mtime for entry in entries if entry.is_file()),
+                default=None,
+            )
+    except OSError:
+        return None
+
+
+class PhotosDBLoader:
+    # Minimum seconds between checks of the library for changes
+    RELOAD_CHECK_INTERVAL = 60
+
+    def __init__(self):
+        self._db: Optional["osxphotos.PhotosDB"] = None
+        self._db_mtime: Optional[float] = None
+        self._labels_dict: Dict[str, int] = {}
+        self._labels_json = "{}"
+        self._ready = threading.Event()
+        self._started = False
+        self._reloading = False
+        self._next_check = 0.0
+        self._start_lock = threading.Lock()
+
+    def start_loading(self):
+        # Loading is deferred until the database is first needed, and only
+        # ever kicked off once
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+
+        thread = threading.Thread(target=self._load)
+        thread.daemon = True  # Make thread exit when main program exits
+        thread.start()
+
+    def _load(self):
+        try:
+            # Imported here so servers without Photos access never load it
+            import osxphotos
+
+            db = osxphotos.PhotosDB()
+            # Taken before reading, so a change made while loading still
+            # triggers the next reload
+            db_mtime = _library_mtime(db.db_path)
+            # labels_as_dict walks the whole library, so snapshot it (and
+            # its serialized form for prompts) once while loading
+            labels_dict = db.labels_as_dict
+            self._labels_json = json.dumps(labels_dict)
+            self._labels_dict = labels_dict
+            self._db_mtime = db_mtime
+            self._db = db
+            logger.info("PhotosDB loaded")
+        except Exception as e:
+            logger.error("Error loading PhotosDB: %s", e)
+        finally:
+            with self._start_lock:
+                self._reloading = False
+            # Wake up waiters even on failure so they don't block forever
+            self._ready.set()
+
+    def _reload_if_changed(self):
+        """
+        Rebuild the snapshot in the background when the library has changed.
+        Callers keep getting the old snapshot until it's done.
+        """
+        now = time.monotonic()
+        with self._start_lock:
+            if self._db is None or self._reloading or now < self._next_check:
+                return
+            self._next_check = now + self.RELOAD_CHECK_INTERVAL
+            if _library_mtime(self._db.db_path) == self._db_mtime:
+                return
+            self._reloading = True
+
+        logger.info("Photos library changed, reloading PhotosDB")
+        thread = threading.Thread(target=self._load)
+        thread.daemon = True
+        thread.start()
+
+    def db(self, timeout: float = 30.0) -> "osxphotos.PhotosDB":
+        """
+        Return the Photos database, blocking for up to timeout seconds while
+        it loads.
+        """
+        self.start_loading()
+        if not self._ready.wait(timeout):
+            raise TimeoutError("PhotosDB still loading")
+        if self._db is None:
+            raise RuntimeError("PhotosDB failed to load")
+        self._reload_if_changed()
+        return self._db
+
+    def labels_dict(self, timeout: float = 30.0) -> Dict[str, int]:
+        """
+        Return the label name -> count snapshot taken when the database loaded.
+        """
+        self.db(timeout)
+        return self._labels_dict
+
+    def labels_json(self, timeout: float = 30.0) -> str:
+        """
+        Return the label snapshot serialized as a JSON object.
+        """
+        self.db(timeout)
+        return self._labels_json
@@ -1,10 +1,14 @@
 import json
 import sys
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import osxphotos
-from thefuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+
+
+# Maximum number of videos exported from the Photos library at once
+EXPORT_WORKERS = 4
 
 
 def load_keywords(keyword_dict):
@@ -41,21 +45,33 @@ def videos_to_json(video_list):
 
 def match_description(description, keyword_dict, threshold=60):
     keywords = load_keywords(keyword_dict)
-
-    matches = defaultdict(int)
-    words = description.lower().split()
-
-    for word in words:
-        for keyword in keywords:
-            ratio = fuzz.ratio(word, keyword)
-            if ratio > threshold:
-                matches[keyword] = max(matches[keyword], ratio)
+    # Repeated words can't change a keyword's best score, so score each once
+    words = list(dict.fromkeys(description.lower().split()))
+
+    # Keywords hit exactly already have a perfect score, so only the rest
+    # need to go through the edit-distance scorer
+    exact = keywords.keys() & set(words)
+    matches = {keyword: 100 for keyword in exact}
+    candidates = [keyword for keyword in keywords if keyword not in exact]
+
+    if words and candidates:
+        # Score every word against every keyword in a single native call,
+        # then keep the best score each keyword reached across all words
+        scores = process.cdist(
+            words, candidates, scorer=fuzz.ratio, score_cutoff=threshold, workers=-1
+        )
+        best = np.rint(scores).max(axis=0)
+        for i in np.flatnonzero(best > threshold):
+            matches[candidates[i]] = int(best[i])
 
     # Return keywords sorted by match ratio
     return sorted(matches.items(), key=lambda x: x[1], reverse=True)
 
 
 def get_videos_by_keyword(photosdb, keyword, start_date=None, end_date=None):
+    # Imported here so the server only loads osxphotos when Photos is in use
+    import osxphotos
+
     # Use only_movies=True instead of is_video=True
     if start_date and end_date:
         videos = photosdb.query(
@@ -87,20 +103,28 @@ def get_videos_by_keyword(photosdb, keyword, start_date=None, end_date=None):
 
 
 def find_and_export_videos(photosdb, keyword, export_path):
+    import osxphotos
+
     videos = photosdb.query(
         osxphotos.QueryOptions(
             label=[keyword], photos=False, movies=True, incloud=True, ignore_case=True
         )
     )
 
-    exported_files = []
-    for video in videos:
+    def export(video):
+        # Catch per video so one failed export doesn't abort the batch
         try:
             exported = video.export(export_path)
-            exported_files.extend(exported)
             print(f"Exported {video.filename} to {exported}")
+            return exported
         except Exception as e:
             print(f"Error exporting {video.filename}: {e}")
+            return []
+
+    exported_files = []
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as pool:
+        for exported in pool.map(export, videos):
+            exported_files.extend(exported)
 
     return exported_files
 
@@ -113,6 +137,8 @@ if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python search_local_videos.py <keyword>")
         sys.exit(1)
+    import osxphotos
+
     photosdb = osxphotos.PhotosDB()
     video_dict = photosdb.labels_as_dict
     videos = get_videos_by_keyword(photosdb, sys.argv[1])
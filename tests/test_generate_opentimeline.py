@@ -0,0 +1,29 @@
+import unittest
+
+from video_editor_mcp.generate_opentimeline import (
+    timecode_to_frames,
+    timecodes_to_frames_batch,
+)
+
+
+class TimecodesToFramesBatchTest(unittest.TestCase):
+    def test_matches_per_timecode_conversion(self):
+        timecodes = ["00:00:00.000", "00:00:01.5", "00:01:02.041", "01:00:00"]
+        self.assertEqual(
+            timecodes_to_frames_batch(timecodes, 24.0).tolist(),
+            [timecode_to_frames(timecode, 24.0) for timecode in timecodes],
+        )
+
+    def test_non_finite_timecodes_are_rejected(self):
+        for bad in ("00:00:nan", "00:inf:00", "-inf:00:00"):
+            with self.subTest(timecode=bad):
+                with self.assertRaisesRegex(ValueError, f"Invalid timecode.*{bad}"):
+                    timecodes_to_frames_batch(["00:00:01.000", bad])
+
+    def test_malformed_timecode_names_the_value(self):
+        with self.assertRaisesRegex(ValueError, "Invalid timecode format: 12"):
+            timecodes_to_frames_batch(["00:00:01.000", "12"])
+
+
+if __name__ == "__main__":
+    unittest.main()
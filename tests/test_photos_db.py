@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+from video_editor_mcp.photos_db import PhotosDBLoader
+
+
+class FakePhotosDB:
+    """Stands in for osxphotos.PhotosDB over a Photos 5+ style library."""
+
+    library = None
+    loads = 0
+
+    def __init__(self):
+        type(self).loads += 1
+        self.db_path = os.path.join(self.library, "database", "photos.db")
+        self.labels_as_dict = {"beach": type(self).loads}
+
+
+class PhotosDBLoaderReloadTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        database = os.path.join(tmp.name, "database")
+        os.mkdir(database)
+        self.stub = os.path.join(database, "photos.db")
+        self.sqlite = os.path.join(database, "Photos.sqlite")
+        for path in (self.stub, self.sqlite):
+            open(path, "wb").close()
+            os.utime(path, (1_000_000, 1_000_000))
+
+        FakePhotosDB.library = tmp.name
+        FakePhotosDB.loads = 0
+        fake_osxphotos = types.SimpleNamespace(PhotosDB=FakePhotosDB)
+        patcher = mock.patch.dict(sys.modules, {"osxphotos": fake_osxphotos})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.loader = PhotosDBLoader()
+        self.loader.RELOAD_CHECK_INTERVAL = 0
+        self.loader.db(timeout=5)
+
+    def wait_for_loads(self, count):
+        deadline = time.monotonic() + 5
+        while FakePhotosDB.loads < count or self.loader._reloading:
+            if time.monotonic() > deadline:
+                self.fail(f"expected {count} loads, saw {FakePhotosDB.loads}")
+            time.sleep(0.01)
+
+    def test_unchanged_library_is_not_reloaded(self):
+        self.loader.db(timeout=5)
+        time.sleep(0.05)
+        self.assertEqual(FakePhotosDB.loads, 1)
+
+    def test_changed_photos_sqlite_triggers_reload(self):
+        # Only Photos.sqlite changes; the legacy photos.db stub keeps its mtime
+        os.utime(self.sqlite, (2_000_000, 2_000_000))
+
+        self.loader.db(timeout=5)
+        self.wait_for_loads(2)
+
+        self.assertEqual(self.loader.labels_dict(timeout=5), {"beach": 2})
+        self.assertEqual(os.path.getmtime(self.stub), 1_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()